@@ -4,15 +4,16 @@ from __future__ import annotations
 
 import ctypes
 from ctypes import wintypes
+import functools
+import io
+import os
+import re
 import subprocess
 import sys
 from pathlib import Path
 from typing import Iterable
 from uuid import UUID
 
-import yaml
-from PIL import Image
-
 
 BASE_DIR = Path(__file__).resolve().parent
 CONFIG_PATH = BASE_DIR / "config.yaml"
@@ -21,6 +22,10 @@ DESKTOP_FALLBACK = Path.home() / "Desktop"
 KNOWN_FOLDER_DESKTOP = "{B4BFCC3A-DB2C-424C-B029-7FE99A87C641}"
 INVALID_FILENAME_CHARS = set('<>:"/\\|?*')
 INVALID_FILENAME_CHARS.add("\0")
+_SANITIZE_TABLE = str.maketrans({ch: "_" for ch in INVALID_FILENAME_CHARS})
+_MULTI_UNDERSCORE = re.compile(r"_+")
+_POWERSHELL_ESCAPE = re.compile(r'[`"]')
+ICO_BASE_SIZES = (256, 128, 96, 64, 48, 32, 24, 16)
 
 
 class GUID(ctypes.Structure):
@@ -33,25 +38,27 @@ class GUID(ctypes.Structure):
 
     @classmethod
     def from_uuid(cls, uuid_obj: UUID) -> "GUID":
-        data = uuid_obj.bytes_le
-        data4 = (ctypes.c_ubyte * 8).from_buffer_copy(data[8:])
-        return cls(
-            int.from_bytes(data[0:4], byteorder="little"),
-            int.from_bytes(data[4:6], byteorder="little"),
-            int.from_bytes(data[6:8], byteorder="little"),
-            data4,
-        )
+        # bytes_le matches the in-memory layout of Data1/Data2/Data3/Data4.
+        guid = cls()
+        ctypes.memmove(ctypes.addressof(guid), uuid_obj.bytes_le, ctypes.sizeof(cls))
+        return guid
 
 
 def sanitize_filename(name: str) -> str:
-    cleaned = ["_" if ch in INVALID_FILENAME_CHARS else ch for ch in name]
-    normalized = "".join(cleaned).strip()
-    return normalized or "Memory"
+    cleaned = _MULTI_UNDERSCORE.sub("_", name.translate(_SANITIZE_TABLE))
+    return cleaned.strip("_ ") or "Memory"
 
 
 def load_config() -> dict:
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as _Loader
+    except ImportError:
+        from yaml import SafeLoader as _Loader
+
     with CONFIG_PATH.open("r", encoding="utf-8") as cfg_file:
-        return yaml.safe_load(cfg_file) or {}
+        return yaml.load(cfg_file, Loader=_Loader) or {}
 
 
 def resolve_path(path_value: str | None) -> Path:
@@ -60,7 +67,7 @@ def resolve_path(path_value: str | None) -> Path:
     candidate = Path(path_value)
     if not candidate.is_absolute():
         candidate = BASE_DIR / candidate
-    candidate = candidate.expanduser().resolve()
+    candidate = Path(os.path.abspath(os.path.expanduser(candidate)))
     if not candidate.exists():
         raise FileNotFoundError(f"Icon image not found: {candidate}")
     if candidate.suffix.lower() not in {".png", ".jpg", ".jpeg"}:
@@ -70,10 +77,13 @@ def resolve_path(path_value: str | None) -> Path:
     return candidate
 
 
+@functools.lru_cache(maxsize=1)
 def get_desktop_path() -> Path:
     if sys.platform != "win32":
         return DESKTOP_FALLBACK
 
+    # Bound here rather than at import time so a shell32 without this export
+    # falls back to DESKTOP_FALLBACK; lru_cache keeps it to a single lookup.
     try:
         SHGetKnownFolderPath = ctypes.windll.shell32.SHGetKnownFolderPath
         SHGetKnownFolderPath.argtypes = [
@@ -113,10 +123,8 @@ def find_python_executable() -> Path:
 
     executable = Path(sys.executable)
     candidates = list(candidates)
-    if executable.exists():
-        candidates.append(executable)
-        pythonw = executable.with_name("pythonw.exe")
-        candidates.append(pythonw)
+    candidates.append(executable)
+    candidates.append(executable.with_name("pythonw.exe"))
 
     for candidate in candidates:
         if candidate.exists():
@@ -126,26 +134,76 @@ def find_python_executable() -> Path:
 
 
 def convert_image_to_ico(image_path: Path, ico_path: Path) -> Path:
-    ico_path.parent.mkdir(parents=True, exist_ok=True)
+    source_stat = image_path.stat()
+    # The icon name depends only on the title, so record which source it was
+    # built from; a different image with the same mtime must not be skipped.
+    stamp_path = ico_path.with_suffix(".ico.stamp")
+    stamp = f"{image_path}\n{source_stat.st_mtime_ns}\n{source_stat.st_size}\n"
+    try:
+        if ico_path.is_file() and stamp_path.read_text(encoding="utf-8") == stamp:
+            return ico_path
+    except OSError:
+        pass
+
+    from PIL import Image
+
     with Image.open(image_path) as img:
-        img = img.convert("RGBA")
+        if img.mode != "RGBA":
+            img = img.convert("RGBA")
         max_dim = max(img.size)
-        base_sizes = [256, 128, 96, 64, 48, 32, 24, 16]
-        sizes = [(size, size) for size in base_sizes if size <= max_dim]
+        sizes = [(size, size) for size in ICO_BASE_SIZES if size <= max_dim]
         if not sizes:
             sizes = [(max_dim, max_dim)]
-        img.save(ico_path, format="ICO", sizes=sizes)
+        buffer = io.BytesIO()
+        img.save(buffer, format="ICO", sizes=sizes)
+    data = buffer.getvalue()
+
+    try:
+        unchanged = ico_path.read_bytes() == data
+    except OSError:
+        unchanged = False
+
+    if not unchanged:
+        ico_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = ico_path.with_suffix(".ico.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, ico_path)
+    # Written even when the bytes match so the fast path above hits next run.
+    try:
+        stamp_path.write_text(stamp, encoding="utf-8")
+    except OSError:
+        pass
     return ico_path
 
 
 def escape_for_powershell(value: str) -> str:
-    return value.replace("`", "``").replace('"', '""')
+    return _POWERSHELL_ESCAPE.sub(lambda match: match.group(0) * 2, value)
 
 
 def create_shortcut(
     shortcut_path: Path, target_executable: Path, working_dir: Path, icon_path: Path
 ) -> None:
     arguments = f'"{str(MEMORY_SCRIPT)}"'
+    try:
+        import win32com.client
+    except ImportError:
+        win32com = None
+    if win32com is not None:
+        try:
+            shell = win32com.client.Dispatch("WScript.Shell")
+            shortcut = shell.CreateShortCut(str(shortcut_path))
+            shortcut.TargetPath = str(target_executable)
+            shortcut.Arguments = arguments
+            shortcut.WorkingDirectory = str(working_dir)
+            shortcut.IconLocation = str(icon_path)
+            shortcut.Save()
+            return
+        except Exception as exc:
+            print(
+                f"COM shortcut creation failed ({exc!r}); falling back to PowerShell.",
+                file=sys.stderr,
+            )
+
     ps_lines = [
         "$shell = New-Object -ComObject WScript.Shell",
         f'$shortcut = $shell.CreateShortcut("{escape_for_powershell(str(shortcut_path))}")',
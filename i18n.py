@@ -1,16 +1,56 @@
 from __future__ import annotations
 
+import copy
+import functools
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+_YAML_CACHE_MAX_ENTRIES = 100
+_T_CACHE_MAX_ENTRIES = 4096
+_MAX_LOAD_WORKERS = 8
+_LOCALE_SUFFIXES = frozenset({".yml", ".yaml"})
+_BUNDLE_CACHE_NAME = ".locale_cache.pkl"
+_BUNDLE_CACHE_VERSION = 2
+_YAML_CACHE: "OrderedDict[Path, Tuple[float, int, object]]" = OrderedDict()
+_YAML_CACHE_LOCK = threading.Lock()
+
+
+def _load_yaml_cached(path: Path) -> object:
+    stat = path.stat()
+    with _YAML_CACHE_LOCK:
+        cached = _YAML_CACHE.get(path)
+        if cached is not None and cached[:2] == (stat.st_mtime, stat.st_size):
+            _YAML_CACHE.move_to_end(path)
+            return copy.deepcopy(cached[2])
+    with path.open("r", encoding="utf-8") as handle:
+        data = yaml.load(handle, Loader=_Loader)
+    with _YAML_CACHE_LOCK:
+        _YAML_CACHE[path] = (stat.st_mtime, stat.st_size, data)
+        _YAML_CACHE.move_to_end(path)
+        while len(_YAML_CACHE) > _YAML_CACHE_MAX_ENTRIES:
+            _YAML_CACHE.popitem(last=False)
+    return copy.deepcopy(data)
+
 
 class I18n:
     def __init__(self, locales_dir: Path, default: str = "de") -> None:
         self.locales_dir = Path(locales_dir)
         self.default = (default or "de").strip().lower()
         self.messages: Dict[str, Dict[str, object]] = {}
+        self._flat: Dict[str, Dict[str, str]] = {}
+        self._t_cache: Dict[str, str] = {}
         self.language_labels: Dict[str, str] = {}
         self.lang = self.default
         self._load_locales()
@@ -21,26 +61,96 @@ class I18n:
     def _load_locales(self) -> None:
         if not self.locales_dir.exists():
             return
-        for path in sorted(self.locales_dir.glob("*.yml")):
-            self._load_locale_file(path)
-        for path in sorted(self.locales_dir.glob("*.yaml")):
-            self._load_locale_file(path)
+        # .yml files load first so a same-named .yaml file takes precedence.
+        paths = sorted(
+            (
+                path
+                for path in self.locales_dir.iterdir()
+                if path.suffix.lower() in _LOCALE_SUFFIXES
+            ),
+            key=lambda path: (path.suffix.lower() == ".yaml", path.name),
+        )
+        if not paths:
+            return
+        cached = self._read_bundle_cache()
+        bundle = {}
+        parsed = [None] * len(paths)
+        missing = []
+        for index, path in enumerate(paths):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            entry = cached.get(path.name)
+            if entry is not None and entry[0] == stamp:
+                parsed[index] = entry[1]
+            else:
+                missing.append(index)
+            bundle[path.name] = (stamp, parsed[index])
+        if missing:
+            workers = min(_MAX_LOAD_WORKERS, len(missing))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(
+                    self._parse_locale_file, [paths[index] for index in missing]
+                )
+                for index, entry in zip(missing, results):
+                    parsed[index] = entry
+                    name = paths[index].name
+                    bundle[name] = (bundle[name][0], entry)
+        if missing or bundle.keys() != cached.keys():
+            self._write_bundle_cache(bundle)
+        for entry in parsed:
+            if entry is None:
+                continue
+            code, label, data = entry
+            if label:
+                self.language_labels[code] = label
+            self.messages[code] = data
+            self._flat[code] = self._flatten(data)
+
+    def _read_bundle_cache(self) -> Dict[str, tuple]:
+        try:
+            with (self.locales_dir / _BUNDLE_CACHE_NAME).open("rb") as handle:
+                version, bundle = pickle.load(handle)
+        except Exception:
+            return {}
+        if version != _BUNDLE_CACHE_VERSION or not isinstance(bundle, dict):
+            return {}
+        return bundle
 
-    def _load_locale_file(self, path: Path) -> None:
+    def _write_bundle_cache(self, bundle: Dict[str, tuple]) -> None:
+        cache_path = self.locales_dir / _BUNDLE_CACHE_NAME
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
         try:
-            with path.open("r", encoding="utf-8") as handle:
-                data = yaml.safe_load(handle) or {}
+            with tmp_path.open("wb") as handle:
+                pickle.dump(
+                    (_BUNDLE_CACHE_VERSION, bundle),
+                    handle,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    @staticmethod
+    def _parse_locale_file(path: Path) -> Optional[Tuple[str, str, Dict[str, object]]]:
+        try:
+            data = _load_yaml_cached(path) or {}
         except (yaml.YAMLError, OSError):
-            return
+            return None
         if not isinstance(data, dict):
-            return
-        meta = data.pop("meta", {}) if isinstance(data, dict) else {}
-        code = path.stem.lower()
+            return None
+        meta = data.pop("meta", {})
+        label = ""
         if isinstance(meta, dict):
-            label = meta.get("language_name")
-            if isinstance(label, str) and label.strip():
-                self.language_labels[code] = label.strip()
-        self.messages[code] = data
+            raw_label = meta.get("language_name")
+            if isinstance(raw_label, str):
+                label = raw_label.strip()
+        return path.stem.lower(), label, data
 
     def set_language(self, code: str) -> bool:
         normalized = (code or "").strip().lower()
@@ -49,24 +159,41 @@ class I18n:
             if normalized not in self.messages and self.messages:
                 normalized = next(iter(self.messages))
         changed = normalized != self.lang
+        if changed:
+            self._t_cache.clear()
         self.lang = normalized
         return changed
 
     def t(self, key: str, **kwargs) -> str:
         if not key:
             return ""
-        parts = key.split(".")
-        value = self._resolve(self.messages.get(self.lang, {}), parts)
-        if value is None and self.default in self.messages:
-            value = self._resolve(self.messages.get(self.default, {}), parts)
-        if not isinstance(value, str):
-            return key
         if kwargs:
+            value = self._lookup(key)
+            if value is None:
+                return key
             try:
                 return value.format(**kwargs)
             except (KeyError, ValueError):
                 return value
-        return value
+        cached = self._t_cache.get(key)
+        if cached is None:
+            cached = self._lookup(key)
+            if cached is None:
+                cached = key
+            if len(self._t_cache) >= _T_CACHE_MAX_ENTRIES:
+                self._t_cache.clear()
+            self._t_cache[key] = cached
+        return cached
+
+    def _lookup(self, key: str) -> Optional[str]:
+        try:
+            return self._flat[self.lang][key]
+        except KeyError:
+            pass
+        try:
+            return self._flat[self.default][key]
+        except KeyError:
+            return None
 
     def get_language_label(self, code: str) -> str:
         normalized = (code or "").strip().lower()
@@ -79,14 +206,17 @@ class I18n:
         return sorted(options, key=lambda item: item[1].lower())
 
     @staticmethod
-    def _resolve(data: object, parts: Iterable[str]) -> object:
-        current = data
-        for part in parts:
-            if not isinstance(current, dict):
-                return None
-            current = current.get(part)
-        return current
+    def _flatten(data: Dict[str, object], prefix: str = "") -> Dict[str, str]:
+        flat: Dict[str, str] = {}
+        for name, value in data.items():
+            key = f"{prefix}{name}"
+            if isinstance(value, dict):
+                flat.update(I18n._flatten(value, f"{key}."))
+            elif isinstance(value, str):
+                flat[key] = value
+        return flat
 
 
+@functools.lru_cache(maxsize=8)
 def build_translator(locales_dir: Path, default: str = "de") -> I18n:
     return I18n(locales_dir, default=default)
@@ -1,13 +1,25 @@
-import copy
+import functools
+import hashlib
 import math
 import os
 import random
+import stat
+import threading
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from PIL import Image, ImageTk, ImageOps
 from pathlib import Path
+from types import MappingProxyType
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 from i18n import I18n
 
 try:
@@ -70,8 +82,31 @@ DEFAULT_CONFIG = {
 }
 
 
+def _freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+DEFAULT_CONFIG = _freeze(DEFAULT_CONFIG)
+
+_DEFAULT_SOUND_EXTENSIONS = DEFAULT_CONFIG["media"]["sounds"]["extensions"]
+_DEFAULT_AVATAR_EXTENSIONS = DEFAULT_CONFIG["media"]["avatars"]["extensions"]
+_GLOBAL_DEFAULT_FONT_SIZE = DEFAULT_CONFIG["ui"]["font"]["emphasis"]["size"]
+
+
+def _clone_plain(value):
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: _clone_plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_clone_plain(item) for item in value]
+    return value
+
+
 def _deep_merge(base, override):
-    result = copy.deepcopy(base)
+    result = _clone_plain(base)
     for key, value in override.items():
         if value is None:
             continue
@@ -85,15 +120,20 @@ def _deep_merge(base, override):
 def _resolve_folder(path_value):
     if not path_value:
         return ""
-    candidate = Path(path_value)
-    if not candidate.is_absolute():
-        candidate = BASE_DIR / candidate
-    return str(candidate)
+    return os.path.normpath(os.path.join(BASE_DIR, path_value))
+
+
+def _section(parent, key):
+    value = parent.get(key)
+    if not isinstance(value, dict):
+        value = {}
+    parent[key] = value
+    return value
 
 
 def _normalize_extensions(values, fallback):
-    if not values:
-        return list(fallback)
+    if not values or tuple(values) == fallback:
+        return fallback
     if isinstance(values, str):
         values = [values]
     normalized = []
@@ -102,55 +142,249 @@ def _normalize_extensions(values, fallback):
             continue
         ext = item if item.startswith(".") else f".{item}"
         normalized.append(ext.lower())
-    return normalized or list(fallback)
+    return normalized or fallback
 
 
 def _resolve_path(path_value):
     if not path_value:
         return ""
-    candidate = Path(path_value)
-    if not candidate.is_absolute():
-        candidate = BASE_DIR / candidate
-    return str(candidate)
+    return os.path.normpath(os.path.join(BASE_DIR, path_value))
 
 
 def _list_media_files(folder, extensions=None):
-    if not folder:
-        return []
-    try:
-        base_path = Path(folder)
-    except TypeError:
-        return []
-    if not base_path.is_dir():
+    if not folder or not isinstance(folder, str):
         return []
     allowed = None
     if extensions:
         allowed = {ext.lower() for ext in extensions}
     files = []
-    for entry in base_path.iterdir():
-        if not entry.is_file():
-            continue
-        if allowed and entry.suffix.lower() not in allowed:
-            continue
-        files.append(str(entry))
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                if allowed and os.path.splitext(entry.name)[1].lower() not in allowed:
+                    continue
+                files.append(entry.path)
+    except OSError:
+        return []
     return files
 
 
+def _thumbnail_cache_dir():
+    cache_root = os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME")
+    if not cache_root:
+        cache_root = os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_root, "mymemorygame", "thumbs")
+
+
+THUMBNAIL_CACHE_DIR = _thumbnail_cache_dir()
+THUMBNAIL_CACHE_MAX_FILES = 2000
+# Bump whenever decoding, resampling or canvas handling changes the output.
+_THUMBNAIL_CACHE_VERSION = 1
+_MAX_DECODE_WORKERS = 8
+_IMAGE_EXTENSIONS = frozenset({"png", "jpg", "jpeg", "gif", "bmp"})
+_IMAGE_EXTENSIONS_ANY_CASE = _IMAGE_EXTENSIONS | {
+    ext.upper() for ext in _IMAGE_EXTENSIONS
+}
+_AVATAR_CANVAS_TEMPLATES = {}
+
+
+def _thumbnail_cache_path(kind, source_path, size):
+    # Any change to the source's mtime or size yields a different key, so a
+    # replaced file is never matched to a stale thumbnail.
+    source_stat = os.stat(source_path)
+    key = (
+        f"{_THUMBNAIL_CACHE_VERSION}:{kind}:{source_path}:"
+        f"{source_stat.st_mtime_ns}:{source_stat.st_size}"
+    )
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return os.path.join(THUMBNAIL_CACHE_DIR, f"{digest}_{size}.png")
+
+
+def _load_cached_thumbnail(cache_path):
+    try:
+        with Image.open(cache_path) as cached:
+            cached.load()
+    except Exception:
+        return None
+    try:
+        # Refresh the mtime so pruning treats the file as recently used.
+        os.utime(cache_path)
+    except OSError:
+        pass
+    return cached
+
+
+def _store_cached_thumbnail(image, cache_path):
+    tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        image.save(tmp_path, "PNG", optimize=False)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _prune_thumbnail_cache(max_files=THUMBNAIL_CACHE_MAX_FILES):
+    try:
+        with os.scandir(THUMBNAIL_CACHE_DIR) as entries:
+            files = []
+            for entry in entries:
+                if entry.name.endswith(".png"):
+                    try:
+                        files.append((entry.stat().st_mtime, entry.path))
+                    except OSError:
+                        pass
+    except OSError:
+        return
+    if len(files) <= max_files:
+        return
+    files.sort()
+    for _, path in files[: len(files) - max_files]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _apply_exif_orientation(img):
+    if img.getexif().get(0x0112, 1) == 1:
+        return img
+    return ImageOps.exif_transpose(img)
+
+
+def _decode_card_image(img_path, target_size):
+    try:
+        thumb_path = _thumbnail_cache_path("card", img_path, target_size)
+        canvas = _load_cached_thumbnail(thumb_path)
+        if canvas is not None:
+            return canvas
+        with Image.open(img_path) as img:
+            if img.format == "JPEG":
+                img.draft("RGB", (target_size * 2, target_size * 2))
+            img = _apply_exif_orientation(img)
+            has_alpha = img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info
+            img = img.convert("RGBA" if has_alpha else "RGB")
+            factor = min(img.width, img.height) // (target_size * 3)
+            if factor >= 2:
+                img = img.reduce(factor)
+            img.thumbnail((target_size, target_size), Image.LANCZOS)
+
+            canvas = Image.new("RGB", (target_size, target_size), "#2b2b2b")
+            offset_x = (target_size - img.width) // 2
+            offset_y = (target_size - img.height) // 2
+            canvas.paste(img, (offset_x, offset_y), img if has_alpha else None)
+        _store_cached_thumbnail(canvas, thumb_path)
+        return canvas
+    except Exception:
+        return None
+
+
+def _scan_image_tree(folder):
+    stamps = [(folder, os.stat(folder).st_mtime_ns)]
+    paths = []
+    pending = [folder]
+    while pending:
+        current = pending.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            if current == folder:
+                raise
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    if not entry.is_symlink():
+                        try:
+                            stamps.append((entry.path, entry.stat().st_mtime_ns))
+                        except OSError:
+                            continue
+                        pending.append(entry.path)
+                    continue
+                _, dot, ext = entry.name.rpartition(".")
+                if dot and (
+                    ext in _IMAGE_EXTENSIONS_ANY_CASE
+                    or ext.lower() in _IMAGE_EXTENSIONS
+                ):
+                    paths.append(entry.path)
+    return stamps, paths
+
+
+def _dir_stamps_current(stamps):
+    try:
+        return all(os.stat(path).st_mtime_ns == mtime for path, mtime in stamps)
+    except OSError:
+        return False
+
+
+def _decode_avatar_image(path, size):
+    try:
+        thumb_path = _thumbnail_cache_path("avatar", path, size)
+        canvas = _load_cached_thumbnail(thumb_path)
+        if canvas is not None:
+            return canvas
+        with Image.open(path) as img:
+            if img.format == "JPEG":
+                img.draft("RGB", (size * 2, size * 2))
+            img = _apply_exif_orientation(img)
+            img = img.convert("RGBA")
+            factor = min(img.width, img.height) // (size * 3)
+            if factor >= 2:
+                img = img.reduce(factor)
+            img.thumbnail((size, size), Image.BICUBIC)
+
+            template = _AVATAR_CANVAS_TEMPLATES.get(size)
+            if template is None:
+                template = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+                _AVATAR_CANVAS_TEMPLATES[size] = template
+            canvas = template.copy()
+            offset = ((size - img.width) // 2, (size - img.height) // 2)
+            canvas.paste(img, offset, img)
+        _store_cached_thumbnail(canvas, thumb_path)
+        return canvas
+    except Exception:
+        return None
+
+
+def _normalize_font_section(section, default_section):
+    if not isinstance(section, dict):
+        section = {}
+
+    size_value = section.get("size", default_section.get("size"))
+    try:
+        size_int = int(size_value)
+    except (TypeError, ValueError):
+        size_int = default_section.get("size", _GLOBAL_DEFAULT_FONT_SIZE)
+    section["size"] = max(1, size_int)
+
+    weight_value = section.get("weight", default_section.get("weight"))
+    if not isinstance(weight_value, str) or not weight_value.strip():
+        weight_value = default_section.get("weight", "normal")
+    section["weight"] = weight_value.strip()
+
+    return section
+
+
 def load_config(config_path=CONFIG_PATH):
     data = {}
-    if config_path.exists():
-        try:
-            with config_path.open("r", encoding="utf-8") as cfg_file:
-                data = yaml.safe_load(cfg_file) or {}
-        except (yaml.YAMLError, OSError):
-            data = {}
+    try:
+        with config_path.open("rb") as cfg_file:
+            data = yaml.load(cfg_file.read(), Loader=_SafeLoader) or {}
+    except (yaml.YAMLError, OSError):
+        data = {}
 
     merged = _deep_merge(DEFAULT_CONFIG, data)
 
-    title_cfg = merged.setdefault("title", {})
-    if not isinstance(title_cfg, dict):
-        title_cfg = {}
-        merged["title"] = title_cfg
+    title_cfg = _section(merged, "title")
     raw_image_cfg = title_cfg.get("image", {})
     if isinstance(raw_image_cfg, str):
         raw_image_cfg = {"path": raw_image_cfg}
@@ -160,23 +394,14 @@ def load_config(config_path=CONFIG_PATH):
     image_cfg = raw_image_cfg
     image_cfg["path"] = _resolve_path(image_cfg.get("path", ""))
 
-    layout_cfg = merged.get("layout")
-    if not isinstance(layout_cfg, dict):
-        layout_cfg = {}
-    merged["layout"] = layout_cfg
+    layout_cfg = _section(merged, "layout")
     layout_cfg["bottom_border_fraction"] = layout_cfg.get(
         "bottom_border_fraction",
         DEFAULT_CONFIG["layout"]["bottom_border_fraction"],
     )
 
-    ui_cfg = merged.get("ui")
-    if not isinstance(ui_cfg, dict):
-        ui_cfg = {}
-    merged["ui"] = ui_cfg
-    font_cfg = ui_cfg.get("font")
-    if not isinstance(font_cfg, dict):
-        font_cfg = {}
-    ui_cfg["font"] = font_cfg
+    ui_cfg = _section(merged, "ui")
+    font_cfg = _section(ui_cfg, "font")
 
     default_font_cfg = DEFAULT_CONFIG["ui"]["font"]
 
@@ -185,64 +410,28 @@ def load_config(config_path=CONFIG_PATH):
         family = default_font_cfg["family"]
     font_cfg["family"] = family.strip()
 
-    def _normalize_font_section(section_name):
-        section = font_cfg.get(section_name)
-        if not isinstance(section, dict):
-            section = {}
-
-        default_section = default_font_cfg.get(section_name, {})
-
-        size_value = section.get("size", default_section.get("size"))
-        try:
-            size_int = int(size_value)
-        except (TypeError, ValueError):
-            size_int = default_section.get(
-                "size", DEFAULT_CONFIG["ui"]["font"]["emphasis"]["size"]
-            )
-        section["size"] = max(1, size_int)
-
-        weight_value = section.get("weight", default_section.get("weight"))
-        if not isinstance(weight_value, str) or not weight_value.strip():
-            weight_value = default_section.get("weight", "normal")
-        section["weight"] = weight_value.strip()
-
-        return section
-
-    font_cfg["title"] = _normalize_font_section("title")
-    font_cfg["emphasis"] = _normalize_font_section("emphasis")
-    font_cfg["body"] = _normalize_font_section("body")
+    for section_name in ("title", "emphasis", "body"):
+        font_cfg[section_name] = _normalize_font_section(
+            font_cfg.get(section_name), default_font_cfg.get(section_name, {})
+        )
 
-    media_cfg = merged.get("media")
-    if not isinstance(media_cfg, dict):
-        media_cfg = {}
-    merged["media"] = media_cfg
+    media_cfg = _section(merged, "media")
 
-    sounds_cfg = media_cfg.get("sounds")
-    if not isinstance(sounds_cfg, dict):
-        sounds_cfg = {}
-    media_cfg["sounds"] = sounds_cfg
+    sounds_cfg = _section(media_cfg, "sounds")
     sounds_folder = _resolve_folder(sounds_cfg.get("folder", ""))
     sounds_cfg["folder"] = sounds_folder
     sounds_cfg["extensions"] = _normalize_extensions(
-        sounds_cfg.get("extensions"),
-        DEFAULT_CONFIG["media"]["sounds"]["extensions"],
+        sounds_cfg.get("extensions"), _DEFAULT_SOUND_EXTENSIONS
     )
 
-    avatars_cfg = media_cfg.get("avatars")
-    if not isinstance(avatars_cfg, dict):
-        avatars_cfg = {}
-    media_cfg["avatars"] = avatars_cfg
+    avatars_cfg = _section(media_cfg, "avatars")
     avatars_folder = _resolve_folder(avatars_cfg.get("folder", ""))
     avatars_cfg["folder"] = avatars_folder
     avatars_cfg["extensions"] = _normalize_extensions(
-        avatars_cfg.get("extensions"),
-        DEFAULT_CONFIG["media"]["avatars"]["extensions"],
+        avatars_cfg.get("extensions"), _DEFAULT_AVATAR_EXTENSIONS
     )
 
-    images_cfg = media_cfg.get("images")
-    if not isinstance(images_cfg, dict):
-        images_cfg = {}
-    media_cfg["images"] = images_cfg
+    images_cfg = _section(media_cfg, "images")
     images_cfg["folder"] = _resolve_folder(images_cfg.get("folder", ""))
 
     sounds_cfg["files"] = _list_media_files(
@@ -283,7 +472,15 @@ BOTTOM_BORDER_FRACTION = LAYOUT_CONFIG.get(
 
 MEDIA_CONFIG = CONFIG.get("media", {})
 SOUNDS_CONFIG = MEDIA_CONFIG.get("sounds", {})
-SOUNDS = SOUNDS_CONFIG.get("files", [])
+SOUNDS = tuple(
+    (path, os.path.splitext(path)[1].lower())
+    for path in SOUNDS_CONFIG.get("files", [])
+    if path
+)
+SOUNDS_BY_EXT = {
+    ext: tuple(path for path, path_ext in SOUNDS if path_ext == ext)
+    for ext in {ext for _, ext in SOUNDS}
+}
 AVATARS_CONFIG = MEDIA_CONFIG.get("avatars", {})
 AVATAR_FOLDER = AVATARS_CONFIG.get("folder", "")
 AVATAR_EXTENSIONS = tuple(AVATARS_CONFIG.get("extensions", []))
@@ -306,28 +503,27 @@ class MemoryApp:
         "#ff9f1c",
         "#9b5de5",
     ]
+    MAX_PLAYERS = len(PLAYER_COLORS)
+    SOUND_MEDIA_CACHE_SIZE = 16
+    AVATAR_SIZES = (54, 48)
+    RECENT_IMAGE_LIMIT = 128
 
     def __init__(self, root):
         self.root = root
         self.root.title(TITLE)
         self.root.configure(bg="#1a1a1a")
-        self.image_cache = {}
+        self.image_cache = weakref.WeakValueDictionary()
+        self._recent_images = OrderedDict()
+        self._avatar_cache = {}
+        self._image_scan_cache = {}
         self.names_window = None
         self.settings_window = None
-        self.available_avatar_options = self.load_avatar_options()
-        self.avatar_lookup = {
-            os.path.abspath(path): name for name, path in self.available_avatar_options
-        }
-        self.default_avatar_path = (
-            next(iter(self.avatar_lookup.keys())) if self.avatar_lookup else ""
-        )
-        if vlc is not None:
-            try:
-                self.vlc_instance = vlc.Instance()
-            except Exception:
-                self.vlc_instance = None
-        else:
-            self.vlc_instance = None
+        self._avatar_options = None
+        self._avatar_lookup = None
+        self._avatar_abspath_cache = {}
+        self._vlc_instance = None
+        self._vlc_instance_built = False
+        self._sound_media_cache = OrderedDict()
         self.vlc_player = None
         self.last_settings = {
             "players": 1,
@@ -378,6 +574,37 @@ class MemoryApp:
         self.init_menu_state()
         self.build_menu()
         self.center_window()
+        self.root.after_idle(self.start_avatar_prewarm)
+        threading.Thread(target=_prune_thumbnail_cache, daemon=True).start()
+
+    @property
+    def available_avatar_options(self):
+        if self._avatar_options is None:
+            self._avatar_options = tuple(self.load_avatar_options())
+        return self._avatar_options
+
+    @property
+    def avatar_lookup(self):
+        if self._avatar_lookup is None:
+            self._avatar_lookup = {
+                path: name for name, path in self.available_avatar_options
+            }
+        return self._avatar_lookup
+
+    @property
+    def default_avatar_path(self):
+        return next(iter(self.avatar_lookup), "")
+
+    @property
+    def vlc_instance(self):
+        if not self._vlc_instance_built:
+            self._vlc_instance_built = True
+            if vlc is not None:
+                try:
+                    self._vlc_instance = vlc.Instance()
+                except Exception:
+                    self._vlc_instance = None
+        return self._vlc_instance
 
     def reset_game_state(self):
         self.folder = ""
@@ -393,6 +620,7 @@ class MemoryApp:
         self.player_names = []
         self.player_avatars = []
 
+        self.image_pool = []
         self.cards = []
         self.buttons = []
         self.card_slots = []
@@ -403,18 +631,18 @@ class MemoryApp:
         self.sidebar_frame = None
         self.board_frame = None
         self.board_grid = None
+        self._board_padding = None
+        self._board_position_pending = None
         self.score_frame = None
-        self.player_containers = []
-        self.score_labels = []
-        self.score_avatar_labels = []
-        self.score_avatar_images = []
+        self.score_rows = []
         self.card_back_image = None
 
         self.review_button = None
         self.post_game_frame = None
         self.menu_button = None
         self.title_photo = None
-        self.matched_paths = []
+        # Insertion-ordered path -> player index; doubles as the dedupe set.
+        self.matched_paths = {}
         self.image_summary_window = None
         self.summary_images = []
         self.sound_toggle_button = None
@@ -436,24 +664,25 @@ class MemoryApp:
         options = []
         if not AVATAR_FOLDER:
             return options
-        folder = Path(AVATAR_FOLDER)
-        if not folder.is_dir():
+        if not os.path.isdir(AVATAR_FOLDER):
             return options
         allowed = (
             {ext.lower() for ext in AVATAR_EXTENSIONS} if AVATAR_EXTENSIONS else None
         )
-        for entry in folder.iterdir():
-            if not entry.is_file():
-                continue
-            if allowed and entry.suffix.lower() not in allowed:
-                continue
-            options.append((entry.stem, str(entry)))
+        with os.scandir(AVATAR_FOLDER) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                stem, ext = os.path.splitext(entry.name)
+                if allowed and ext.lower() not in allowed:
+                    continue
+                options.append((stem, entry.path))
         options.sort(key=lambda item: item[0].lower())
         return options
 
     def init_menu_state(self):
         initial_players = max(
-            1, min(self.last_settings.get("players", 1), len(self.PLAYER_COLORS))
+            1, min(self.last_settings.get("players", 1), self.MAX_PLAYERS)
         )
         initial_folder = self.last_settings.get("folder", "")
         initial_pairs = max(1, self.last_settings.get("pairs", 1))
@@ -465,6 +694,9 @@ class MemoryApp:
         self.folder_var = tk.StringVar(value=initial_folder)
         self.pairs_var = tk.IntVar(value=initial_pairs)
         self.available_images = 0
+        self._folder_is_dir = False
+        self._stats_folder = None
+        self._start_state_pending = None
 
         self.menu_frame = None
         self.image_info_label = None
@@ -478,10 +710,8 @@ class MemoryApp:
         self.menu_form = None
         self.player_name_vars = []
         self.player_names_entries_frame = None
+        self._name_rows = []
         self.player_avatar_vars = []
-        self.player_avatar_buttons = {}
-        self.player_avatar_preview_labels = {}
-        self.player_avatar_preview_images = {}
         self.language_button = None
         self.last_player_names = list(self.last_settings.get("names", []))
         raw_avatars = self.last_settings.get("avatars", [])
@@ -498,9 +728,8 @@ class MemoryApp:
 
         self.title_photo = None
         if TITLE_IMAGE_PATH:
-            title_path = os.path.abspath(TITLE_IMAGE_PATH)
             title_image = self.load_title_image(
-                title_path,
+                TITLE_IMAGE_PATH,
                 max_width=TITLE_IMAGE_MAX_WIDTH,
                 max_height=TITLE_IMAGE_MAX_HEIGHT,
             )
@@ -537,18 +766,16 @@ class MemoryApp:
         player_controls = tk.Frame(player_row, bg="#1a1a1a")
         player_controls.pack(side="right")
 
-        btn_style = {
+        base_btn_style = {
             "bg": "#3d3d3d",
             "fg": "#f5f5f5",
             "activebackground": "#555555",
             "activeforeground": "#f5f5f5",
             "relief": "flat",
             "font": self.ui_font_emphasis,
-            "width": 2,
-            "height": 1,
-            "padx": 12,
-            "pady": 8,
         }
+        btn_style = dict(base_btn_style, width=2, height=1, padx=12, pady=8)
+        action_btn_style = dict(base_btn_style, padx=16, pady=8)
 
         self.player_minus_btn = tk.Button(
             player_controls,
@@ -607,14 +834,9 @@ class MemoryApp:
             folder_controls,
             text=_("menu.browse_button"),
             command=self.browse_folder,
-            bg="#3d3d3d",
-            fg="#f5f5f5",
-            activebackground="#555555",
-            activeforeground="#f5f5f5",
-            relief="flat",
             padx=10,
             pady=6,
-            font=self.ui_font_emphasis,
+            **base_btn_style,
         ).pack(side="left", padx=(8, 0))
 
         self.image_info_label = tk.Label(
@@ -688,60 +910,34 @@ class MemoryApp:
             button_row,
             text=_("menu.names_button"),
             command=self.open_names_dialog,
-            bg="#3d3d3d",
-            fg="#f5f5f5",
-            activebackground="#555555",
-            activeforeground="#f5f5f5",
-            relief="flat",
-            padx=16,
-            pady=8,
-            font=self.ui_font_emphasis,
+            **action_btn_style,
         ).pack(side="left", padx=8)
 
         tk.Button(
             button_row,
             text=_("menu.other_settings_button"),
             command=self.open_settings_dialog,
-            bg="#3d3d3d",
-            fg="#f5f5f5",
-            activebackground="#555555",
-            activeforeground="#f5f5f5",
-            relief="flat",
-            padx=16,
-            pady=8,
-            font=self.ui_font_emphasis,
+            **action_btn_style,
         ).pack(side="left", padx=8)
 
         tk.Button(
             button_row,
             text=_("menu.quit_button"),
             command=self.root.destroy,
-            bg="#3d3d3d",
-            fg="#f5f5f5",
-            activebackground="#555555",
-            activeforeground="#f5f5f5",
-            relief="flat",
-            padx=16,
-            pady=8,
-            font=self.ui_font_emphasis,
+            **action_btn_style,
         ).pack(side="left", padx=8)
 
-        self.folder_var.trace_add("write", lambda *_: self.update_start_state())
-        self.pairs_var.trace_add("write", lambda *_: self.update_start_state())
-        self.player_var.trace_add("write", lambda *_: self.update_start_state())
+        self.folder_var.trace_add("write", self.schedule_update_start_state)
+        self.pairs_var.trace_add("write", self.update_start_state)
+        self.player_var.trace_add("write", self.update_start_state)
         self.refresh_image_stats(self.folder_var.get())
         self.center_window()
 
     def destroy_game_ui(self):
-        if self.image_summary_window is not None:
-            try:
-                if self.image_summary_window.winfo_exists():
-                    self.image_summary_window.destroy()
-            except tk.TclError:
-                pass
-            finally:
-                self.image_summary_window = None
-                self.summary_images = []
+        self.close_image_summary_window()
+        if self._board_position_pending is not None:
+            self.root.after_cancel(self._board_position_pending)
+            self._board_position_pending = None
         if self.board_frame is not None:
             self.board_frame.unbind("<Configure>")
             self.board_frame.destroy()
@@ -772,20 +968,31 @@ class MemoryApp:
         if not SOUNDS:
             return
 
-        sound_path = random.choice(SOUNDS)
-        if not sound_path:
-            return
-
-        abs_path = os.path.abspath(sound_path)
-        if not os.path.isfile(abs_path):
-            return
-
-        _, ext = os.path.splitext(abs_path)
-        ext = ext.lower()
+        if self.vlc_instance is None:
+            wav_sounds = SOUNDS_BY_EXT.get(".wav")
+            if winsound is None or not wav_sounds:
+                return
+            abs_path, ext = random.choice(wav_sounds), ".wav"
+        else:
+            abs_path, ext = random.choice(SOUNDS)
 
         if self.vlc_instance is not None:
             try:
-                media = self.vlc_instance.media_new_path(abs_path)
+                media_cache = self._sound_media_cache
+                media = media_cache.get(abs_path)
+                if media is None:
+                    media = self.vlc_instance.media_new_path(abs_path)
+                    if len(media_cache) >= self.SOUND_MEDIA_CACHE_SIZE:
+                        # libvlc keeps its own reference for a player still
+                        # using the evicted media, so releasing ours is safe.
+                        _, evicted = media_cache.popitem(last=False)
+                        try:
+                            evicted.release()
+                        except Exception:
+                            pass
+                    media_cache[abs_path] = media
+                else:
+                    media_cache.move_to_end(abs_path)
                 player = self.vlc_instance.media_player_new()
                 player.set_media(media)
                 if self.vlc_player is not None:
@@ -818,12 +1025,19 @@ class MemoryApp:
 
     def refresh_image_stats(self, folder_path=None):
         folder = folder_path or self.folder_var.get()
-        if folder and os.path.isdir(folder):
+        self._stats_folder = folder
+        try:
+            folder_stat = os.stat(folder) if folder else None
+        except OSError:
+            folder_stat = None
+        if folder_stat is not None and stat.S_ISDIR(folder_stat.st_mode):
             image_paths = self.get_image_paths(folder)
             self.available_images = len(image_paths)
+            self._folder_is_dir = True
         else:
             image_paths = []
             self.available_images = 0
+            self._folder_is_dir = False
 
         if self.available_images > 0:
             info_text = _("menu.images_found", count=self.available_images)
@@ -841,72 +1055,85 @@ class MemoryApp:
         self.image_info_label.config(text=info_text, fg=info_color)
         self.update_start_state()
 
+    def schedule_update_start_state(self, *_):
+        if self._start_state_pending is not None:
+            self.root.after_cancel(self._start_state_pending)
+        self._start_state_pending = self.root.after(150, self._run_pending_start_state)
+
+    def _run_pending_start_state(self):
+        self._start_state_pending = None
+        if self.menu_frame is None:
+            return
+        folder = self.folder_var.get()
+        if folder != self._stats_folder:
+            # Only a cheap directory check while typing; the full rescan waits
+            # for FocusOut, browse or start so partial paths are never walked.
+            try:
+                self._folder_is_dir = bool(folder) and stat.S_ISDIR(
+                    os.stat(folder).st_mode
+                )
+            except OSError:
+                self._folder_is_dir = False
+        self.update_start_state()
+
     def update_start_state(self, *_):
+        player_raw = pairs_raw = None
         try:
-            player_count = int(self.player_var.get())
+            player_raw = self.player_var.get()
+            player_count = int(player_raw)
         except Exception:
             player_count = 1
-        player_count = max(1, min(player_count, len(self.PLAYER_COLORS)))
-        if player_count != self.player_var.get():
+        player_count = max(1, min(player_count, self.MAX_PLAYERS))
+        if player_count != player_raw:
             self.player_var.set(player_count)
 
         try:
-            pair_count = int(self.pairs_var.get())
+            pairs_raw = self.pairs_var.get()
+            pair_count = int(pairs_raw)
         except Exception:
             pair_count = 0
 
         if self.available_images > 0:
             pair_count = max(1, min(pair_count, self.available_images))
-            if pair_count != self.pairs_var.get():
-                self.pairs_var.set(pair_count)
         else:
             pair_count = 0
-            if self.pairs_var.get() != 0:
-                self.pairs_var.set(0)
+        if pair_count != pairs_raw:
+            self.pairs_var.set(pair_count)
 
-        folder_ok = bool(self.folder_var.get()) and os.path.isdir(self.folder_var.get())
         pairs_ok = pair_count >= 1 and pair_count <= self.available_images
 
-        if folder_ok and pairs_ok:
+        if self._folder_is_dir and pairs_ok:
             self.start_button.config(state="normal")
         else:
             self.start_button.config(state="disabled")
 
-        self.update_player_controls()
-        self.update_pairs_controls()
+        self.update_player_controls(player_count)
+        self.update_pairs_controls(pair_count)
 
-    def update_player_controls(self):
+    def update_player_controls(self, player_count=None):
+        if player_count is None:
+            player_count = self.player_var.get()
         if self.player_value_label is not None:
-            self.player_value_label.config(text=str(self.player_var.get()))
+            self.player_value_label.config(text=str(player_count))
         if self.player_minus_btn is not None:
-            state = "normal" if self.player_var.get() > 1 else "disabled"
+            state = "normal" if player_count > 1 else "disabled"
             self.player_minus_btn.config(state=state)
         if self.player_plus_btn is not None:
-            state = (
-                "normal"
-                if self.player_var.get() < len(self.PLAYER_COLORS)
-                else "disabled"
-            )
+            state = "normal" if player_count < self.MAX_PLAYERS else "disabled"
             self.player_plus_btn.config(state=state)
         self.rebuild_player_name_inputs()
 
-    def update_pairs_controls(self):
+    def update_pairs_controls(self, pair_count=None):
+        if pair_count is None:
+            pair_count = self.pairs_var.get()
+        available = self.available_images
         if self.pairs_value_label is not None:
-            self.pairs_value_label.config(text=str(self.pairs_var.get()))
+            self.pairs_value_label.config(text=str(pair_count))
         if self.pairs_minus_btn is not None:
-            state = (
-                "normal"
-                if self.available_images > 0 and self.pairs_var.get() > 1
-                else "disabled"
-            )
+            state = "normal" if available > 0 and pair_count > 1 else "disabled"
             self.pairs_minus_btn.config(state=state)
         if self.pairs_plus_btn is not None:
-            state = (
-                "normal"
-                if self.available_images > 0
-                and self.pairs_var.get() < self.available_images
-                else "disabled"
-            )
+            state = "normal" if available > 0 and pair_count < available else "disabled"
             self.pairs_plus_btn.config(state=state)
 
     def update_sound_toggle_button(self):
@@ -933,7 +1160,7 @@ class MemoryApp:
         self.update_sound_toggle_button()
 
     def ensure_player_name_vars(self, desired):
-        desired = max(1, min(desired, len(self.PLAYER_COLORS)))
+        desired = max(1, min(desired, self.MAX_PLAYERS))
         while len(self.player_name_vars) < desired:
             idx = len(self.player_name_vars)
             default = ""
@@ -946,62 +1173,93 @@ class MemoryApp:
     def normalize_avatar_path(self, path):
         if not path:
             return ""
-        abs_path = os.path.abspath(path)
+        abs_path = self._avatar_abspath_cache.get(path)
+        if abs_path is None:
+            abs_path = os.path.abspath(path)
+            self._avatar_abspath_cache[path] = abs_path
         return abs_path if abs_path in self.avatar_lookup else ""
 
     def ensure_player_avatar_vars(self, desired):
-        desired = max(1, min(desired, len(self.PLAYER_COLORS)))
+        desired = max(1, min(desired, self.MAX_PLAYERS))
         while len(self.player_avatar_vars) < desired:
             idx = len(self.player_avatar_vars)
             default = ""
             if idx < len(self.last_player_avatars):
                 default = self.normalize_avatar_path(self.last_player_avatars[idx])
-            if not default:
-                default = self.default_avatar_path
-            self.player_avatar_vars.append(tk.StringVar(value=default or ""))
+            self.player_avatar_vars.append(tk.StringVar(value=default))
 
-    def is_valid_avatar_path(self, path):
-        return bool(self.normalize_avatar_path(path))
-
-    def get_avatar_label(self, path):
-        normalized = self.normalize_avatar_path(path)
+    def get_avatar_label(self, path, already_normalized=False):
+        normalized = path if already_normalized else self.normalize_avatar_path(path)
         if not normalized:
             return _("avatars.default_label")
         return self.avatar_lookup.get(normalized, _("avatars.default_label"))
 
-    def get_avatar_photo(self, path, size=56):
-        normalized = self.normalize_avatar_path(path)
+    def get_avatar_photo(self, path, size=56, already_normalized=False):
+        normalized = path if already_normalized else self.normalize_avatar_path(path)
         if not normalized:
             return None
         cache_key = ("avatar", normalized, size)
-        cached = self.image_cache.get(cache_key)
+        cached = self._avatar_cache.get(cache_key)
         if cached is not None:
             return cached
+        canvas = _decode_avatar_image(normalized, size)
+        if canvas is None:
+            return None
         try:
-            with Image.open(normalized) as img:
-                img = ImageOps.exif_transpose(img)
-                img = img.convert("RGBA")
-                img.thumbnail((size, size), Image.LANCZOS)
-
-                canvas = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-                offset = ((size - img.width) // 2, (size - img.height) // 2)
-                canvas.paste(img, offset, img)
-
-                photo = ImageTk.PhotoImage(canvas)
-                self.image_cache[cache_key] = photo
-                return photo
+            photo = ImageTk.PhotoImage(canvas)
+            self._avatar_cache[cache_key] = photo
+            return photo
         except Exception:
             return None
 
+    def start_avatar_prewarm(self):
+        options = self._avatar_options
+        scanned = []
+        results = deque()
+
+        def decode_all():
+            avatar_options = options
+            if avatar_options is None:
+                # Scan the avatar folder here rather than on the Tk thread; the
+                # poll hands the result to available_avatar_options.
+                try:
+                    avatar_options = tuple(self.load_avatar_options())
+                except OSError:
+                    return
+                scanned.append(avatar_options)
+            for _, path in avatar_options:
+                path = os.path.abspath(path)
+                for size in self.AVATAR_SIZES:
+                    results.append((path, size, _decode_avatar_image(path, size)))
+
+        worker = threading.Thread(target=decode_all, daemon=True)
+        worker.start()
+        self.root.after(50, self.poll_avatar_prewarm, worker, scanned, results)
+
+    def poll_avatar_prewarm(self, worker, scanned, results):
+        if scanned and self._avatar_options is None:
+            self._avatar_options = scanned[0]
+        while results:
+            path, size, canvas = results.popleft()
+            cache_key = ("avatar", path, size)
+            if canvas is None or cache_key in self._avatar_cache:
+                continue
+            try:
+                self._avatar_cache[cache_key] = ImageTk.PhotoImage(canvas)
+            except Exception:
+                pass
+        if worker.is_alive() or results:
+            self.root.after(50, self.poll_avatar_prewarm, worker, scanned, results)
+
     def get_avatar_placeholder(self, index, size=56):
-        color = self.PLAYER_COLORS[index % len(self.PLAYER_COLORS)]
+        color = self.PLAYER_COLORS[index % self.MAX_PLAYERS]
         cache_key = ("avatar_placeholder", color, size)
-        cached = self.image_cache.get(cache_key)
+        cached = self._avatar_cache.get(cache_key)
         if cached is not None:
             return cached
         img = Image.new("RGB", (size, size), color)
         photo = ImageTk.PhotoImage(img)
-        self.image_cache[cache_key] = photo
+        self._avatar_cache[cache_key] = photo
         return photo
 
     def set_player_avatar(self, index, path):
@@ -1023,39 +1281,53 @@ class MemoryApp:
             if self.player_names and index < len(self.player_names):
                 self.player_names[index] = display_name
                 self.update_score_labels()
-        self.update_avatar_button_label(index)
-        self.update_avatar_preview(index)
+        self.update_avatar_button_label(index, normalized=normalized)
+        self.update_avatar_preview(index, normalized=normalized)
 
-    def update_avatar_button_label(self, index):
-        button = self.player_avatar_buttons.get(index)
-        if button is None:
+    def get_name_row(self, index):
+        if 0 <= index < len(self._name_rows):
+            return self._name_rows[index]
+        return None
+
+    def update_avatar_button_label(self, index, normalized=None):
+        row = self.get_name_row(index)
+        if row is None:
             return
-        label = self.get_avatar_label(
-            self.player_avatar_vars[index].get()
-            if index < len(self.player_avatar_vars)
-            else ""
-        )
-        button.config(text=label)
+        if normalized is not None:
+            label = self.get_avatar_label(normalized, already_normalized=True)
+        else:
+            label = self.get_avatar_label(
+                self.player_avatar_vars[index].get()
+                if index < len(self.player_avatar_vars)
+                else ""
+            )
+        if label != row["button_text"]:
+            row["button"].config(text=label)
+            row["button_text"] = label
 
-    def update_avatar_preview(self, index):
-        label_widget = self.player_avatar_preview_labels.get(index)
-        if label_widget is None:
+    def update_avatar_preview(self, index, normalized=None):
+        row = self.get_name_row(index)
+        if row is None:
             return
-        path = (
-            self.player_avatar_vars[index].get()
-            if index < len(self.player_avatar_vars)
-            else ""
-        )
-        photo = self.get_avatar_photo(path, size=54)
+        if normalized is not None:
+            photo = self.get_avatar_photo(normalized, size=54, already_normalized=True)
+        else:
+            path = (
+                self.player_avatar_vars[index].get()
+                if index < len(self.player_avatar_vars)
+                else ""
+            )
+            photo = self.get_avatar_photo(path, size=54)
         if photo is None:
             photo = self.get_avatar_placeholder(index, size=54)
-        label_widget.config(image=photo)
-        label_widget.image = photo
-        self.player_avatar_preview_images[index] = photo
+        if photo is row["preview_image"]:
+            return
+        row["preview"].config(image=photo)
+        row["preview_image"] = photo
 
     def rebuild_player_name_inputs(self):
         desired = int(self.player_var.get()) if self.player_var is not None else 1
-        desired = max(1, min(desired, len(self.PLAYER_COLORS)))
+        desired = max(1, min(desired, self.MAX_PLAYERS))
 
         self.ensure_player_name_vars(desired)
         self.ensure_player_avatar_vars(desired)
@@ -1063,73 +1335,99 @@ class MemoryApp:
         if self.player_names_entries_frame is None:
             return
 
-        for widget in self.player_names_entries_frame.winfo_children():
-            widget.destroy()
+        default_avatar = self.default_avatar_path
+        for avatar_var in self.player_avatar_vars[:desired]:
+            if not avatar_var.get() and default_avatar:
+                avatar_var.set(default_avatar)
 
+        for row in self._name_rows[desired:]:
+            if row["frame"].winfo_manager():
+                row["frame"].pack_forget()
         for i in range(desired):
-            row = tk.Frame(self.player_names_entries_frame, bg="#1a1a1a")
-            row.pack(fill="x", pady=6)
+            if i < len(self._name_rows):
+                frame = self._name_rows[i]["frame"]
+                if not frame.winfo_manager():
+                    frame.pack(fill="x", pady=6)
+            else:
+                self._name_rows.append(self.create_player_name_row(i))
 
-            left = tk.Frame(row, bg="#1a1a1a")
-            left.pack(side="left", fill="x", expand=True)
+            self.update_avatar_button_label(i)
+            self.update_avatar_preview(i)
 
-            tk.Label(
-                left,
-                text=_("names_dialog.player_label", index=i + 1),
-                fg="#f5f5f5",
-                bg="#1a1a1a",
-                font=self.ui_font_emphasis,
-                anchor="w",
-            ).pack(anchor="w")
+    def create_player_name_row(self, index):
+        row = tk.Frame(self.player_names_entries_frame, bg="#1a1a1a")
+        row.pack(fill="x", pady=6)
 
-            tk.Entry(
-                left,
-                textvariable=self.player_name_vars[i],
-                bg="#2b2b2b",
-                fg="#f5f5f5",
-                insertbackground="#f5f5f5",
-                relief="flat",
-                font=self.ui_font_body,
-            ).pack(fill="x", pady=(4, 0))
+        left = tk.Frame(row, bg="#1a1a1a")
+        left.pack(side="left", fill="x", expand=True)
+
+        tk.Label(
+            left,
+            text=_("names_dialog.player_label", index=index + 1),
+            fg="#f5f5f5",
+            bg="#1a1a1a",
+            font=self.ui_font_emphasis,
+            anchor="w",
+        ).pack(anchor="w")
 
-            right = tk.Frame(row, bg="#1a1a1a")
-            right.pack(side="left", padx=(12, 0))
+        tk.Entry(
+            left,
+            textvariable=self.player_name_vars[index],
+            bg="#2b2b2b",
+            fg="#f5f5f5",
+            insertbackground="#f5f5f5",
+            relief="flat",
+            font=self.ui_font_body,
+        ).pack(fill="x", pady=(4, 0))
 
-            preview = tk.Label(right, bg="#1a1a1a")
-            preview.pack()
-            self.player_avatar_preview_labels[i] = preview
+        right = tk.Frame(row, bg="#1a1a1a")
+        right.pack(side="left", padx=(12, 0))
 
-            button = tk.Menubutton(
-                right,
-                text=_("avatars.menu_label"),
-                bg="#3d3d3d",
-                fg="#f5f5f5",
-                activebackground="#555555",
-                activeforeground="#f5f5f5",
-                relief="flat",
-                font=self.ui_font_emphasis,
-                padx=12,
-                pady=6,
-                direction="below",
-            )
-            button.pack(fill="x", pady=(6, 0))
-            self.player_avatar_buttons[i] = button
-
-            menu = tk.Menu(button, tearoff=0, bg="#2b2b2b", fg="#f5f5f5")
-            if self.available_avatar_options:
-                for option_name, option_path in self.available_avatar_options:
-                    menu.add_command(
-                        label=option_name,
-                        command=lambda p=option_path, idx=i: self.set_player_avatar(
-                            idx, p
-                        ),
-                    )
-            else:
-                menu.add_command(label=_("avatars.none_available"), state="disabled")
-            button.config(menu=menu)
+        preview = tk.Label(right, bg="#1a1a1a")
+        preview.pack()
 
-            self.update_avatar_button_label(i)
-            self.update_avatar_preview(i)
+        button_text = _("avatars.menu_label")
+        button = tk.Menubutton(
+            right,
+            text=button_text,
+            bg="#3d3d3d",
+            fg="#f5f5f5",
+            activebackground="#555555",
+            activeforeground="#f5f5f5",
+            relief="flat",
+            font=self.ui_font_emphasis,
+            padx=12,
+            pady=6,
+            direction="below",
+        )
+        button.pack(fill="x", pady=(6, 0))
+
+        menu = tk.Menu(button, tearoff=0, bg="#2b2b2b", fg="#f5f5f5")
+        menu.config(
+            postcommand=functools.partial(self.populate_avatar_menu, menu, index)
+        )
+        button.config(menu=menu)
+        return {
+            "frame": row,
+            "button": button,
+            "button_text": button_text,
+            "preview": preview,
+            "preview_image": None,
+        }
+
+    def populate_avatar_menu(self, menu, index):
+        if menu.index("end") is not None:
+            return
+        if self.available_avatar_options:
+            for option_name, option_path in self.available_avatar_options:
+                menu.add_command(
+                    label=option_name,
+                    command=functools.partial(
+                        self.set_player_avatar, index, option_path
+                    ),
+                )
+        else:
+            menu.add_command(label=_("avatars.none_available"), state="disabled")
 
     def close_names_window(self):
         window = self.names_window
@@ -1137,15 +1435,22 @@ class MemoryApp:
             return
         self.names_window = None
         self.player_names_entries_frame = None
-        self.player_avatar_buttons = {}
-        self.player_avatar_preview_labels = {}
-        self.player_avatar_preview_images = {}
+        self._name_rows = []
         try:
             if window.winfo_exists():
                 window.destroy()
         except tk.TclError:
             pass
 
+    def populate_language_menu(self, menu):
+        if menu.index("end") is not None:
+            return
+        for code, label in I18N.get_language_options():
+            menu.add_command(
+                label=label,
+                command=lambda c=code: self.set_language(c),
+            )
+
     def close_settings_window(self):
         window = self.settings_window
         if window is None:
@@ -1200,6 +1505,7 @@ class MemoryApp:
         frame = tk.Frame(container, bg="#1a1a1a")
         frame.pack(fill="both", expand=True)
         self.player_names_entries_frame = frame
+        self._name_rows = []
         self.names_window = window
 
         self.rebuild_player_name_inputs()
@@ -1288,11 +1594,9 @@ class MemoryApp:
             activebackground="#555555",
             activeforeground="#f5f5f5",
         )
-        for code, label in I18N.get_language_options():
-            language_menu.add_command(
-                label=label,
-                command=lambda c=code: self.set_language(c),
-            )
+        language_menu.config(
+            postcommand=lambda: self.populate_language_menu(language_menu)
+        )
         self.language_button.config(menu=language_menu)
 
         sounds_row = tk.Frame(container, bg="#1a1a1a")
@@ -1347,21 +1651,21 @@ class MemoryApp:
         window.protocol("WM_DELETE_WINDOW", self.close_settings_window)
 
     def change_player_count(self, delta):
-        new_value = self.player_var.get() + delta
-        new_value = max(1, min(new_value, len(self.PLAYER_COLORS)))
-        if new_value != self.player_var.get():
+        current = self.player_var.get()
+        new_value = max(1, min(current + delta, self.MAX_PLAYERS))
+        if new_value != current:
             self.player_var.set(new_value)
-        self.update_player_controls()
+        self.update_player_controls(new_value)
 
     def change_pair_count(self, delta):
         if self.available_images <= 0:
             return
-        new_value = self.pairs_var.get() + delta
-        new_value = max(1, min(new_value, self.available_images))
-        if new_value != self.pairs_var.get():
+        current = self.pairs_var.get()
+        new_value = max(1, min(current + delta, self.available_images))
+        if new_value != current:
             self.pairs_var.set(new_value)
         else:
-            self.update_pairs_controls()
+            self.update_pairs_controls(new_value)
 
     def start_game(self):
         folder = self.folder_var.get()
@@ -1395,7 +1699,7 @@ class MemoryApp:
             num_players = int(self.player_var.get())
         except Exception:
             num_players = 1
-        num_players = max(1, min(num_players, len(self.PLAYER_COLORS)))
+        num_players = max(1, min(num_players, self.MAX_PLAYERS))
 
         self.ensure_player_name_vars(num_players)
         self.ensure_player_avatar_vars(num_players)
@@ -1482,13 +1786,7 @@ class MemoryApp:
 
         shuffled_paths = self.image_paths[:]
         random.shuffle(shuffled_paths)
-        loaded_images = []
-        for path in shuffled_paths:
-            photo = self.load_image(path, self.card_size)
-            if photo is not None:
-                loaded_images.append((photo, path))
-            if len(loaded_images) == self.num_pairs:
-                break
+        loaded_images = self.load_card_images(shuffled_paths, self.num_pairs)
 
         if len(loaded_images) < self.num_pairs:
             messagebox.showerror(
@@ -1498,6 +1796,7 @@ class MemoryApp:
             self.return_to_menu()
             return
 
+        # image_pool pins the board's photos while they are only weakly cached.
         self.image_pool = loaded_images
         self.cards = self.prepare_cards()
         self.buttons = []
@@ -1506,50 +1805,92 @@ class MemoryApp:
         self.matched = set()
 
         self.create_board()
-        self.board_frame.bind("<Configure>", self.position_board)
+        self.board_frame.bind("<Configure>", self.schedule_position_board)
         self.position_board()
         self.update_turn_indicator()
         self.update_score_labels()
 
+    def load_card_images(self, paths, count):
+        size = self.card_size
+        loaded_images = []
+        remaining = list(paths)
+        executor = None
+        try:
+            while remaining and len(loaded_images) < count:
+                needed = count - len(loaded_images)
+                batch, remaining = remaining[:needed], remaining[needed:]
+                pending = [
+                    path for path in batch if (path, size) not in self.image_cache
+                ]
+                canvases = {}
+                if pending:
+                    if executor is None:
+                        executor = ThreadPoolExecutor(
+                            max_workers=min(_MAX_DECODE_WORKERS, os.cpu_count() or 1)
+                        )
+                    decoded = executor.map(
+                        lambda path: _decode_card_image(path, size), pending
+                    )
+                    canvases = dict(zip(pending, decoded))
+                for path in batch:
+                    if path in canvases and canvases[path] is None:
+                        continue
+                    photo = self.load_image(path, size, canvas=canvases.get(path))
+                    if photo is not None:
+                        loaded_images.append((photo, path))
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        return loaded_images
+
     def get_image_paths(self, folder=None):
-        valid_ext = (".png", ".jpg", ".jpeg", ".gif", ".bmp")
-        paths = []
         search_folder = folder or self.folder
-        if not search_folder or not os.path.isdir(search_folder):
+        if not search_folder:
+            return []
+        cached = self._image_scan_cache.get(search_folder)
+        if cached is not None and _dir_stamps_current(cached[0]):
+            return list(cached[1])
+        try:
+            stamps, paths = _scan_image_tree(search_folder)
+        except OSError:
+            self._image_scan_cache.pop(search_folder, None)
             return []
-        for root_dir, _, files in os.walk(search_folder):
-            for file in files:
-                if file.lower().endswith(valid_ext):
-                    paths.append(os.path.join(root_dir, file))
         paths.sort()
-        return paths
+        self._image_scan_cache[search_folder] = (stamps, paths)
+        return list(paths)
+
+    def get_cached_image(self, cache_key):
+        photo = self.image_cache.get(cache_key)
+        if photo is not None:
+            self.remember_recent_image(cache_key, photo)
+        return photo
+
+    def cache_image(self, cache_key, photo):
+        self.image_cache[cache_key] = photo
+        self.remember_recent_image(cache_key, photo)
+
+    def remember_recent_image(self, cache_key, photo):
+        self._recent_images[cache_key] = photo
+        self._recent_images.move_to_end(cache_key)
+        while len(self._recent_images) > self.RECENT_IMAGE_LIMIT:
+            self._recent_images.popitem(last=False)
 
-    def load_image(self, img_path, target_size):
+    def load_image(self, img_path, target_size, canvas=None):
         cache_key = (img_path, target_size)
-        cached = self.image_cache.get(cache_key)
+        cached = self.get_cached_image(cache_key)
         if cached is not None:
             return cached
 
+        if canvas is None:
+            canvas = _decode_card_image(img_path, target_size)
+            if canvas is None:
+                return None
         try:
-            with Image.open(img_path) as img:
-                img = ImageOps.exif_transpose(img)
-                img = img.convert("RGBA")
-                img.thumbnail((target_size, target_size), Image.LANCZOS)
-
-                canvas = Image.new("RGBA", (target_size, target_size), "#2b2b2b")
-                offset_x = (target_size - img.width) // 2
-                offset_y = (target_size - img.height) // 2
-                canvas.paste(
-                    img,
-                    (offset_x, offset_y),
-                    img if img.mode == "RGBA" else None,
-                )
-
-                photo = ImageTk.PhotoImage(canvas.convert("RGB"))
-                self.image_cache[cache_key] = photo
-                return photo
+            photo = ImageTk.PhotoImage(canvas)
         except Exception:
             return None
+        self.cache_image(cache_key, photo)
+        return photo
 
     def load_title_image(
         self,
@@ -1558,17 +1899,21 @@ class MemoryApp:
         max_height=TITLE_IMAGE_MAX_HEIGHT,
     ):
         cache_key = ("title", img_path, max_width, max_height)
-        cached = self.image_cache.get(cache_key)
+        cached = self.get_cached_image(cache_key)
         if cached is not None:
             return cached
 
         try:
             with Image.open(img_path) as img:
-                img = ImageOps.exif_transpose(img)
+                if img.format == "JPEG":
+                    # Square bound so an EXIF rotation cannot leave it undersized.
+                    bound = max(max_width, max_height) * 2
+                    img.draft("RGB", (bound, bound))
+                img = _apply_exif_orientation(img)
                 img = img.convert("RGBA")
                 img.thumbnail((max_width, max_height), Image.LANCZOS)
                 photo = ImageTk.PhotoImage(img.convert("RGB"))
-                self.image_cache[cache_key] = photo
+                self.cache_image(cache_key, photo)
                 return photo
         except Exception:
             return None
@@ -1576,18 +1921,18 @@ class MemoryApp:
     def apply_window_icon(self):
         if not SHORTCUT_IMAGE_PATH:
             return
-        icon_path = os.path.abspath(SHORTCUT_IMAGE_PATH)
+        icon_path = SHORTCUT_IMAGE_PATH
         cache_key = ("window_icon", icon_path)
-        icon_photo = self.image_cache.get(cache_key)
+        icon_photo = self.get_cached_image(cache_key)
         if icon_photo is None:
             try:
                 with Image.open(icon_path) as img:
-                    img = ImageOps.exif_transpose(img)
+                    img = _apply_exif_orientation(img)
                     img = img.convert("RGBA")
                     icon_photo = ImageTk.PhotoImage(img)
             except Exception:
                 return
-            self.image_cache[cache_key] = icon_photo
+            self.cache_image(cache_key, icon_photo)
         self.root.iconphoto(True, icon_photo)
         self.window_icon = icon_photo
 
@@ -1613,10 +1958,7 @@ class MemoryApp:
         self.score_frame = tk.Frame(parent, bg="#1a1a1a")
         self.score_frame.pack(fill="both", expand=True)
 
-        self.player_containers = []
-        self.score_labels = []
-        self.score_avatar_labels = []
-        self.score_avatar_images = []
+        self.score_rows = []
 
         players_wrapper = tk.Frame(self.score_frame, bg="#1a1a1a")
         players_wrapper.pack(fill="both", expand=True)
@@ -1646,19 +1988,25 @@ class MemoryApp:
             avatar_label = tk.Label(inner, bg=self.player_colors[i])
             avatar_label.pack(side="left", padx=(0, 10))
 
+            score_text = _("scoreboard.entry", name=display_name, score=0)
             label = tk.Label(
                 inner,
-                text=_("scoreboard.entry", name=display_name, score=0),
+                text=score_text,
                 fg="#f5f5f5",
                 bg=self.player_colors[i],
                 font=self.ui_font_emphasis,
             )
             label.pack(side="left", fill="x", expand=True)
 
-            self.player_containers.append(container)
-            self.score_labels.append(label)
-            self.score_avatar_labels.append(avatar_label)
-            self.score_avatar_images.append(None)
+            self.score_rows.append(
+                {
+                    "container": container,
+                    "label": label,
+                    "text": score_text,
+                    "avatar_label": avatar_label,
+                    "avatar_image": None,
+                }
+            )
             self.update_scoreboard_avatar(i)
 
         self.post_game_frame = tk.Frame(self.score_frame, bg="#1a1a1a")
@@ -1718,10 +2066,9 @@ class MemoryApp:
             )
             return
 
-        if (
-            self.image_summary_window is not None
-            and self.image_summary_window.winfo_exists()
-        ):
+        # Every path that destroys the gallery clears image_summary_window, so
+        # the attribute doubles as the liveness flag without asking Tk.
+        if self.image_summary_window is not None:
             self.image_summary_window.lift()
             self.image_summary_window.focus_force()
             return
@@ -1798,31 +2145,32 @@ class MemoryApp:
         grid_frame = tk.Frame(content, bg="#1a1a1a")
         grid_frame.pack(fill="both", expand=True)
 
-        seen_paths = set()
-        folder_abs = os.path.abspath(self.folder) if self.folder else None
-        entries = []
-
-        for entry in self.matched_paths:
-            path = entry.get("path")
-            if not path or path in seen_paths:
-                continue
-            seen_paths.add(path)
-            entries.append((path, entry.get("player")))
-
+        # Resolve every path once against a single getcwd() instead of calling
+        # os.path.abspath per sort comparison and again while rendering.
+        cwd = os.getcwd()
+        folder_abs = (
+            os.path.normpath(os.path.join(cwd, self.folder)) if self.folder else None
+        )
         if folder_abs:
+            folder_key = os.path.normcase(folder_abs)
+            folder_prefix = (
+                folder_key if folder_key.endswith(os.sep) else folder_key + os.sep
+            )
+        entries = []
 
-            def sort_key(item):
-                abs_path = os.path.abspath(item[0])
-                try:
-                    if os.path.commonpath([folder_abs, abs_path]) == folder_abs:
-                        return os.path.relpath(abs_path, folder_abs)
-                except (ValueError, OSError):
-                    pass
-                return abs_path
+        for path, player_idx in self.matched_paths.items():
+            abs_path = os.path.normpath(os.path.join(cwd, path))
+            rel_path = None
+            if folder_abs:
+                path_key = os.path.normcase(abs_path)
+                if path_key == folder_key:
+                    rel_path = os.curdir
+                elif path_key.startswith(folder_prefix):
+                    rel_path = abs_path[len(folder_prefix) :]
+            sort_text = (rel_path if rel_path is not None else abs_path).lower()
+            entries.append((sort_text, abs_path, rel_path, path, player_idx))
 
-            entries.sort(key=lambda item: sort_key(item).lower())
-        else:
-            entries.sort(key=lambda item: os.path.abspath(item[0]).lower())
+        entries.sort(key=lambda item: item[0])
 
         if not entries:
             tk.Label(
@@ -1839,9 +2187,21 @@ class MemoryApp:
             base_size = getattr(self, "card_size", 220) or 220
             thumb_size = min(max(base_size + 80, 260), 360)
 
-            for index, (path, player_idx) in enumerate(entries, start=1):
-                row = (index - 1) // 3
-                col = (index - 1) % 3
+            folder_name = os.path.basename(folder_abs) if folder_abs else ""
+            folder_name_prefix = folder_name + os.sep if folder_name else ""
+            pending_thumbs = []
+            player_colors = self.player_colors
+            body_font = self.ui_font_body
+            emphasis_font = self.ui_font_emphasis
+            # One keep-alive slot per tile, filled as thumbnails become available.
+            summary_images = self.summary_images = [None] * len(entries)
+            get_cached_image = self.get_cached_image
+            found_by_texts = {}
+
+            for index, (_sort_text, abs_path, rel_path, path, player_idx) in enumerate(
+                entries, start=1
+            ):
+                row, col = divmod(index - 1, 3)
                 item_frame = tk.Frame(
                     grid_frame,
                     bg="#2b2b2b",
@@ -1850,12 +2210,12 @@ class MemoryApp:
                 )
                 item_frame.grid(row=row, column=col, padx=12, pady=12, sticky="n")
 
-                image = self.load_image(path, thumb_size)
+                image = get_cached_image((path, thumb_size))
                 if image is not None:
                     img_label = tk.Label(item_frame, image=image, bg="#2b2b2b")
                     img_label.image = image
                     img_label.pack()
-                    self.summary_images.append(image)
+                    summary_images[index - 1] = image
                 else:
                     placeholder = tk.Frame(
                         item_frame,
@@ -1865,61 +2225,131 @@ class MemoryApp:
                     )
                     placeholder.pack_propagate(False)
                     placeholder.pack()
-                    tk.Label(
-                        placeholder,
-                        text=_("gallery.not_loaded"),
-                        fg="#ff9f1c",
-                        bg="#1a1a1a",
-                        font=self.ui_font_body,
-                        justify="center",
-                    ).pack(expand=True)
-
-                abs_path = os.path.abspath(path)
-                display_path = abs_path
-                if folder_abs:
-                    try:
-                        if os.path.commonpath([folder_abs, abs_path]) == folder_abs:
-                            # Get the relative path from the folder
-                            rel_path = os.path.relpath(abs_path, folder_abs)
-                            # Get the folder name and combine it with the relative path
-                            folder_name = os.path.basename(folder_abs)
-                            display_path = os.path.join(folder_name, rel_path)
-                    except (ValueError, OSError):
-                        display_path = abs_path
+                    if os.path.isfile(path):
+                        pending_thumbs.append((index - 1, path, placeholder))
+                    else:
+                        # Missing sources never reach Pillow or the worker pool.
+                        self.install_summary_thumbnail(
+                            index - 1, placeholder, path, thumb_size, None
+                        )
+
+                if rel_path is not None:
+                    # Combine the folder name with the path relative to it
+                    display_path = folder_name_prefix + rel_path
+                else:
+                    display_path = abs_path
 
                 tk.Label(
                     item_frame,
                     text=f"{index}. {display_path}",
                     fg="#f5f5f5",
                     bg="#2b2b2b",
-                    font=self.ui_font_body,
+                    font=body_font,
                     wraplength=thumb_size + 80,
                     justify="center",
                 ).pack(pady=(10, 0))
 
-                if player_idx is not None and 0 <= player_idx < len(self.player_colors):
-                    player_text = _(
-                        "gallery.found_by",
-                        player=self.resolve_player_name(player_idx),
-                    )
+                if player_idx is not None and 0 <= player_idx < len(player_colors):
+                    player_text = found_by_texts.get(player_idx)
+                    if player_text is None:
+                        player_text = _(
+                            "gallery.found_by",
+                            player=self.resolve_player_name(player_idx),
+                        )
+                        found_by_texts[player_idx] = player_text
                     tk.Label(
                         item_frame,
                         text=player_text,
-                        fg=self.player_colors[player_idx],
+                        fg=player_colors[player_idx],
                         bg="#2b2b2b",
-                        font=self.ui_font_emphasis,
+                        font=emphasis_font,
                     ).pack(pady=(6, 0))
 
-        def close_window():
-            if self.image_summary_window is not None:
-                try:
-                    self.image_summary_window.destroy()
-                except tk.TclError:
-                    pass
-            self.image_summary_window = None
-            self.summary_images = []
+            if pending_thumbs:
+                self.start_summary_thumbnails(pending_thumbs, thumb_size)
+
+        self.image_summary_window.protocol(
+            "WM_DELETE_WINDOW", self.close_image_summary_window
+        )
+
+    def close_image_summary_window(self):
+        window = self.image_summary_window
+        if window is None:
+            return
+        self.image_summary_window = None
+        self.summary_images = []
+        try:
+            window.destroy()
+        except tk.TclError:
+            pass
+
+    def start_summary_thumbnails(self, jobs, size):
+        window = self.image_summary_window
+        results = deque()
+        executor = ThreadPoolExecutor(
+            max_workers=min(_MAX_DECODE_WORKERS, os.cpu_count() or 1)
+        )
 
-        self.image_summary_window.protocol("WM_DELETE_WINDOW", close_window)
+        def queue_result(slot, path, placeholder, future):
+            if not future.cancelled():
+                results.append((slot, path, placeholder, future.result()))
+
+        for slot, path, placeholder in jobs:
+            future = executor.submit(_decode_card_image, path, size)
+            future.add_done_callback(
+                functools.partial(queue_result, slot, path, placeholder)
+            )
+        self.root.after(
+            50,
+            self.poll_summary_thumbnails,
+            window,
+            executor,
+            results,
+            len(jobs),
+            size,
+        )
+
+    def poll_summary_thumbnails(self, window, executor, results, remaining, size):
+        if window is not self.image_summary_window:
+            executor.shutdown(wait=False, cancel_futures=True)
+            return
+        while results:
+            slot, path, placeholder, canvas = results.popleft()
+            remaining -= 1
+            self.install_summary_thumbnail(slot, placeholder, path, size, canvas)
+        if remaining:
+            self.root.after(
+                50,
+                self.poll_summary_thumbnails,
+                window,
+                executor,
+                results,
+                remaining,
+                size,
+            )
+        else:
+            executor.shutdown(wait=False)
+
+    def install_summary_thumbnail(self, slot, placeholder, path, size, canvas):
+        image = None
+        if canvas is not None:
+            image = self.load_image(path, size, canvas=canvas)
+        if image is None:
+            tk.Label(
+                placeholder,
+                text=_("gallery.not_loaded"),
+                fg="#ff9f1c",
+                bg="#1a1a1a",
+                font=self.ui_font_body,
+                justify="center",
+            ).pack(expand=True)
+            return
+        placeholder.configure(bg="#2b2b2b")
+        placeholder.pack_propagate(True)
+        img_label = tk.Label(placeholder, image=image, bg="#2b2b2b")
+        img_label.image = image
+        img_label.pack()
+        self.summary_images[slot] = image
 
     def create_board(self):
         for i in range(self.num_cards):
@@ -1932,7 +2362,8 @@ class MemoryApp:
                 highlightbackground="#1a1a1a",
                 highlightcolor="#1a1a1a",
             )
-            slot.grid(row=i // self.cols, column=i % self.cols, padx=6, pady=6)
+            row, col = divmod(i, self.cols)
+            slot.grid(row=row, column=col, padx=6, pady=6)
 
             btn = tk.Button(
                 slot,
@@ -1974,15 +2405,8 @@ class MemoryApp:
             self.play_match_sound()
             if self.card_paths:
                 path = self.card_paths[i1]
-                if path and not any(
-                    entry["path"] == path for entry in self.matched_paths
-                ):
-                    self.matched_paths.append(
-                        {
-                            "path": path,
-                            "player": self.current_player,
-                        }
-                    )
+                if path and path not in self.matched_paths:
+                    self.matched_paths[path] = self.current_player
             self.update_score_labels()
         else:
             for i in self.flipped:
@@ -1993,8 +2417,8 @@ class MemoryApp:
             self.finish_game()
 
     def calculate_grid(self, total_cards):
-        cols = math.ceil(math.sqrt(total_cards))
-        rows = math.ceil(total_cards / cols)
+        cols = math.isqrt(total_cards - 1) + 1
+        rows = (total_cards + cols - 1) // cols
         return rows, cols
 
     def calculate_card_size(self, rows, cols, header_height=0, sidebar_width=0):
@@ -2006,20 +2430,26 @@ class MemoryApp:
         available_h = max(320, screen_h - header_height - 160)
         available_h = int(available_h * (1 - BOTTOM_BORDER_FRACTION))
 
-        size_w = available_w / cols
-        size_h = available_h / rows
-        base_size = int(min(size_w, size_h))
+        base_size = min(available_w // cols, available_h // rows)
         if base_size <= 0:
             base_size = 60
 
         return min(base_size, 240)
 
     def create_card_back(self, size):
-        img = Image.new("RGB", (size, size), "#2b2b2b")
-        return ImageTk.PhotoImage(img)
+        cache_key = ("card_back", size)
+        cached = self.get_cached_image(cache_key)
+        if cached is not None:
+            return cached
+        # A flat colour needs no Pillow buffer; let Tk fill the image itself.
+        photo = tk.PhotoImage(width=size, height=size)
+        photo.put("#2b2b2b", to=(0, 0, size, size))
+        self.cache_image(cache_key, photo)
+        return photo
 
     def update_turn_indicator(self):
-        for i, container in enumerate(self.player_containers):
+        for i, row in enumerate(self.score_rows):
+            container = row["container"]
             if i == self.current_player:
                 container.config(
                     highlightbackground="#f5f5f5", highlightcolor="#f5f5f5"
@@ -2050,28 +2480,28 @@ class MemoryApp:
         return ""
 
     def update_scoreboard_avatar(self, index):
-        if index >= len(self.score_avatar_labels):
-            return
-        label = self.score_avatar_labels[index]
-        if label is None:
+        if index >= len(self.score_rows):
             return
+        row = self.score_rows[index]
         path = self.resolve_player_avatar(index)
-        photo = self.get_avatar_photo(path, size=48)
+        photo = self.get_avatar_photo(path, size=48, already_normalized=True)
         if photo is None:
             photo = self.get_avatar_placeholder(index, size=48)
-        label.config(image=photo)
-        label.image = photo
-        self.score_avatar_images[index] = photo
+        if photo is row["avatar_image"]:
+            return
+        row["avatar_label"].config(image=photo)
+        row["avatar_image"] = photo
 
     def update_score_labels(self):
-        for i, label in enumerate(self.score_labels):
-            label.config(
-                text=_(
-                    "scoreboard.entry",
-                    name=self.resolve_player_name(i),
-                    score=self.player_scores[i],
-                )
+        for i, row in enumerate(self.score_rows):
+            text = _(
+                "scoreboard.entry",
+                name=self.resolve_player_name(i),
+                score=self.player_scores[i],
             )
+            if text != row["text"]:
+                row["label"].config(text=text)
+                row["text"] = text
             self.update_scoreboard_avatar(i)
 
     def color_matched_cards(self, indices, player_index):
@@ -2096,36 +2526,38 @@ class MemoryApp:
             )
             return
 
-        best_score = max(self.player_scores)
-        winners = [
-            i + 1 for i, score in enumerate(self.player_scores) if score == best_score
-        ]
+        resolve_name = self.resolve_player_name
+        best_score = None
+        winners = []
+        names = []
+        score_lines = []
+        for i, score in enumerate(self.player_scores):
+            if best_score is None or score > best_score:
+                best_score = score
+                winners = [i]
+            elif score == best_score:
+                winners.append(i)
+            name = resolve_name(i)
+            names.append(name)
+            score_lines.append(
+                _("dialogs.multi_player_score_line", name=name, pairs=score)
+            )
         if len(winners) == 1:
-            player_index = winners[0] - 1
-            winner_name = self.resolve_player_name(player_index)
+            winner_name = names[winners[0]]
             header = _(
                 "dialogs.multi_player_header_single",
                 name=winner_name,
                 pairs=best_score,
             )
         else:
-            winner_str = ", ".join(
-                self.resolve_player_name(winner - 1) for winner in winners
-            )
+            winner_str = ", ".join([names[winner] for winner in winners])
             header = _(
                 "dialogs.multi_player_header_multi",
                 names=winner_str,
                 pairs=best_score,
             )
 
-        scoreboard = "\n".join(
-            _(
-                "dialogs.multi_player_score_line",
-                name=self.resolve_player_name(i),
-                pairs=score,
-            )
-            for i, score in enumerate(self.player_scores)
-        )
+        scoreboard = "\n".join(score_lines)
         messagebox.showinfo(_("dialogs.congrats_title"), f"{header}\n\n{scoreboard}")
 
     def center_window(self):
@@ -2137,8 +2569,24 @@ class MemoryApp:
             self.root.geometry(f"{screen_w}x{screen_h}")
         self.root.update_idletasks()
 
+    def schedule_position_board(self, event):
+        if self._board_position_pending is not None:
+            self.root.after_cancel(self._board_position_pending)
+        self._board_position_pending = self.root.after(
+            50, self._run_pending_board_position, event
+        )
+
+    def _run_pending_board_position(self, event):
+        self._board_position_pending = None
+        if self.board_frame is None:
+            return
+        self.position_board(event)
+
     def position_board(self, event=None):
-        self.board_frame.update_idletasks()
+        # <Configure> is delivered after layout, so only a direct call needs to
+        # flush pending geometry before measuring.
+        if event is None:
+            self.board_frame.update_idletasks()
         frame_w = self.board_frame.winfo_width()
         frame_h = self.board_frame.winfo_height()
         board_w = self.board_grid.winfo_reqwidth()
@@ -2146,6 +2594,9 @@ class MemoryApp:
 
         pad_x = max(0, (frame_w - board_w) // 2)
         pad_y = max(0, (frame_h - board_h) // 2)
+        if (pad_x, pad_y) == self._board_padding:
+            return
+        self._board_padding = (pad_x, pad_y)
         self.board_grid.grid_configure(padx=pad_x, pady=pad_y)
 
     def set_language(self, code):
@@ -2179,7 +2630,7 @@ class MemoryApp:
             self.root.after(0, self.open_settings_dialog)
 
     def refresh_game_texts(self):
-        if self.score_labels:
+        if self.score_rows:
             self.update_score_labels()
         if self.review_button is not None:
             self.review_button.config(text=_("buttons.review_gallery"))
@@ -2195,17 +2646,7 @@ class MemoryApp:
             )
         if self.sound_toggle_button is not None:
             self.update_sound_toggle_button()
-        if (
-            self.image_summary_window is not None
-            and self.image_summary_window.winfo_exists()
-        ):
-            try:
-                self.image_summary_window.destroy()
-            except tk.TclError:
-                pass
-            finally:
-                self.image_summary_window = None
-                self.summary_images = []
+        self.close_image_summary_window()
 
 
 if __name__ == "__main__":
@@ -23,6 +23,7 @@ for /f "usebackq tokens=* delims=" %%I in (`powershell -NoProfile -Command ^
     "}" ^
     "$invalid = [IO.Path]::GetInvalidFileNameChars();" ^
     "$clean = -join ($text.ToCharArray() | ForEach-Object { if ($invalid -contains $_) { '_' } else { $_ } });" ^
+    "$clean = ($clean -replace '_+', '_').Trim('_', ' ');" ^
     "if ([string]::IsNullOrWhiteSpace($clean)) { $clean = 'Memory' }" ^
     "Write-Output $clean"`) do set "SHORTCUT_NAME=%%I"
 
@@ -39,6 +40,10 @@ echo Remove .venv ...
 if exist .venv (
     rmdir /s /q .venv
 )
+echo Remove thumbnail cache ...
+if exist "%LOCALAPPDATA%\mymemorygame" (
+    rmdir /s /q "%LOCALAPPDATA%\mymemorygame"
+)
 endlocal
 echo Done.
 pause